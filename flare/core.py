@@ -2,18 +2,75 @@
 import os
 import sys
 import json
+import logging
 import subprocess
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import time
 import signal
+import threading
 import atexit
+import functools
+import hashlib
+import types
 import re
-import random
-import string
+import secrets
 import argparse
+import urllib.parse
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    # orjson is a fast Rust JSON codec; fall back to the stdlib when the
+    # wheel is unavailable
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 CLOUDFLARE_API_URL = "https://api.cloudflare.com/client/v4"
 
+# Account metadata barely ever changes, so repeated invocations can skip
+# the /accounts and /zones round-trips for a day
+_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "flare", "account.json")
+_CACHE_TTL = 24 * 60 * 60
+
+logger = logging.getLogger("flare")
+
+# Shared session so all API calls reuse one pooled TLS connection
+_SESSION = None
+
+def get_session():
+    global _SESSION
+    if _SESSION is None:
+        # Deferred so that importing the module (and e.g. `flare --help`)
+        # doesn't pay the requests/urllib3 import cost
+        import requests
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                connect=3,
+                read=3,
+                status=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST", "PUT", "DELETE"],
+                respect_retry_after_header=True
+            )
+        )
+        session.mount("https://", adapter)
+        session.headers.update(get_headers())
+        atexit.register(session.close)
+        _SESSION = session
+    return _SESSION
+
+@functools.lru_cache(maxsize=1)
 def get_api_key():
     api_key = os.environ.get("CLOUDFLARE_API_KEY")
     if not api_key:
@@ -21,237 +78,284 @@ def get_api_key():
         sys.exit(1)
     return api_key
 
-def get_headers():
+def _build_headers():
+    """Detect the auth scheme once and build the final header dict."""
     api_key = get_api_key()
-    
+
     # If API key starts with a domain or email, it's likely an API token that doesn't need Bearer
     # If it's a shorter alphanumeric token, it's likely a scoped API token that needs Bearer
     if '@' in api_key or '.' in api_key:
         # This is likely an email:key format (Global API Key)
-        email, key = api_key.split(':')
-        return {
+        email, _, key = api_key.partition(':')
+        return types.MappingProxyType({
             "X-Auth-Email": email,
             "X-Auth-Key": key,
             "Content-Type": "application/json"
-        }
+        })
     else:
         # This is likely an API Token
-        return {
+        return types.MappingProxyType({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
-        }
+        })
 
-def get_account_id():
-    headers = get_headers()
-    response = requests.get(f"{CLOUDFLARE_API_URL}/accounts", headers=headers)
-    
-    if response.status_code != 200:
-        print(f"Error getting account ID: {response.status_code}")
+@functools.lru_cache(maxsize=1)
+def get_headers():
+    return _build_headers()
+
+@dataclass(frozen=True)
+class CloudflareAPI:
+    """Prebuilt endpoint URLs for one account."""
+    account_id: str
+    base: str = CLOUDFLARE_API_URL
+
+    @property
+    def account_base(self):
+        return f"{self.base}/accounts/{self.account_id}"
+
+    def tunnels(self):
+        return f"{self.account_base}/tunnels"
+
+    def cfd_tunnel(self, tunnel_id=None):
+        url = f"{self.account_base}/cfd_tunnel"
+        return f"{url}/{tunnel_id}" if tunnel_id else url
+
+    def tunnel_token(self, tunnel_id):
+        return f"{self.account_base}/cfd_tunnel/{tunnel_id}/token"
+
+    def tunnel_configurations(self, tunnel_id):
+        return f"{self.account_base}/cfd_tunnel/{tunnel_id}/configurations"
+
+    def zones(self):
+        return f"{self.account_base}/zones"
+
+    def dns_records(self, zone_id, dns_id=None):
+        url = f"{self.base}/zones/{zone_id}/dns_records"
+        return f"{url}/{dns_id}" if dns_id else url
+
+@functools.lru_cache(maxsize=1)
+def _api(account_id):
+    return CloudflareAPI(account_id)
+
+def _preview(response):
+    """Short JSON preview of a response body for debug logging."""
+    try:
+        return json.dumps(_loads(response.content))[:200]
+    except Exception:
+        return response.content[:200]
+
+def _cache_key():
+    return hashlib.blake2b(get_api_key().encode(), digest_size=16).hexdigest()
+
+def _read_cache():
+    with open(_CACHE_FILE) as f:
+        return json.load(f)
+
+def _atomic_write(path, data):
+    """Write `data` to `path` atomically, readable only by the owner."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def _invalidate_cache():
+    try:
+        os.remove(_CACHE_FILE)
+    except OSError:
+        pass
+
+def _cached(name, loader):
+    """Look `name` up in the on-disk cache, calling loader() on a miss.
+
+    The cache is keyed by a hash of the API key so switching accounts never
+    serves stale data, and expires after _CACHE_TTL. All cache I/O is
+    best-effort; any problem falls through to the network path.
+    """
+    try:
+        if time.time() - os.path.getmtime(_CACHE_FILE) < _CACHE_TTL:
+            entry = _read_cache().get(_cache_key(), {})
+            if name in entry:
+                logger.debug("Using cached %s", name)
+                return entry[name]
+    except (OSError, ValueError):
+        pass
+
+    value = loader()
+
+    try:
         try:
-            print(response.json())
-        except json.JSONDecodeError:
-            print(f"Response content: {response.content}")
-        sys.exit(1)
-    
-    accounts = response.json().get("result", [])
+            cache = _read_cache()
+        except (OSError, ValueError):
+            cache = {}
+        cache.setdefault(_cache_key(), {})[name] = value
+        os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+        _atomic_write(_CACHE_FILE, json.dumps(cache))
+    except OSError:
+        pass
+
+    return value
+
+def get_account_id():
+    return _cached("account_id", _fetch_account_id)
+
+def _fetch_account_id():
+    response = get_session().get(f"{CLOUDFLARE_API_URL}/accounts")
+
+    if response.status_code in (401, 403):
+        _invalidate_cache()
+    response.raise_for_status()
+
+    accounts = _loads(response.content).get("result", [])
     if not accounts:
         print("No Cloudflare accounts found")
         sys.exit(1)
-    
+
     return accounts[0]['id']
 
-def create_tunnel(account_id, tunnel_name, debug=False):
-    headers = get_headers()
-    
-    # Check if tunnel with this name already exists
-    if debug:
-        print(f"Debug: Checking for existing tunnel named '{tunnel_name}'")
-        print(f"Debug: API URL: {CLOUDFLARE_API_URL}/accounts/{account_id}/tunnels")
-        print(f"Debug: Headers: {headers}")
-    
-    response = requests.get(
-        f"{CLOUDFLARE_API_URL}/accounts/{account_id}/tunnels",
-        headers=headers
-    )
-    
-    if debug:
-        print(f"Debug: List tunnels response status: {response.status_code}")
-        print(f"Debug: Response headers: {response.headers}")
-        print(f"Debug: Response content: {response.content[:200]}")
-    
-    if response.status_code != 200:
-        print(f"Error checking existing tunnels: {response.status_code}")
-        try:
-            print(response.json())
-        except json.JSONDecodeError:
-            print(f"Response content: {response.content}")
-        sys.exit(1)
-    
-    tunnels = response.json().get("result", [])
-    for tunnel in tunnels:
-        if tunnel.get("name") == tunnel_name:
-            if debug:
-                print(f"Debug: Found existing tunnel with ID: {tunnel['id']}")
-            return tunnel["id"], tunnel["name"]
-    
+# Zones for the current account, resolved at most once per process (on top
+# of the on-disk cache) since setup and teardown both need them
+_ZONES_CACHE = None
+
+def _get_zones(account_id):
+    global _ZONES_CACHE
+    if _ZONES_CACHE is None:
+        _ZONES_CACHE = _cached("zones", lambda: _fetch_zones(account_id))
+    return _ZONES_CACHE
+
+def _fetch_zones(account_id):
+    response = get_session().get(_api(account_id).zones())
+
+    logger.debug("Zones response status: %s", response.status_code)
+
+    if response.status_code in (401, 403):
+        _invalidate_cache()
+    response.raise_for_status()
+    return _loads(response.content).get("result", [])
+
+def create_tunnel(account_id, tunnel_name):
+    # Check if tunnel with this name already exists; filtering server-side
+    # avoids transferring and scanning the full tunnel list
+    logger.debug("Checking for existing tunnel named '%s'", tunnel_name)
+
+    query = urllib.parse.urlencode({"name": tunnel_name, "is_deleted": "false"})
+    response = get_session().get(f"{_api(account_id).cfd_tunnel()}?{query}")
+
+    logger.debug("List tunnels response status: %s", response.status_code)
+    logger.debug("Response content: %s", response.content[:200])
+
+    response.raise_for_status()
+
+    tunnels = _loads(response.content).get("result", [])
+    if tunnels:
+        logger.debug("Found existing tunnel with ID: %s", tunnels[0]['id'])
+        return tunnels[0]["id"], tunnels[0]["name"]
+
     # Create a new tunnel
     data = {
         "name": tunnel_name,
-        "tunnel_secret": ''.join(random.choices(string.ascii_letters + string.digits, k=32))
+        "tunnel_secret": secrets.token_hex(32)
     }
-    
-    if debug:
-        print(f"Debug: Creating new tunnel with name: {tunnel_name}")
-        print(f"Debug: API URL: {CLOUDFLARE_API_URL}/accounts/{account_id}/tunnels")
-        # Don't print the secret in logs
-        print(f"Debug: Request data: {json.dumps({k: v if k != 'tunnel_secret' else '[SECRET]' for k, v in data.items()})}")
-    
-    response = requests.post(
-        f"{CLOUDFLARE_API_URL}/accounts/{account_id}/tunnels",
-        headers=headers,
-        json=data
+
+    # Don't log the secret
+    logger.debug("Creating new tunnel with name: %s", tunnel_name)
+
+    response = get_session().post(
+        _api(account_id).tunnels(),
+        data=_dumps(data)
     )
-    
-    if debug:
-        print(f"Debug: Create tunnel response status: {response.status_code}")
-        print(f"Debug: Response headers: {response.headers}")
-        print(f"Debug: Response content: {response.content[:200]}")
-    
-    if response.status_code != 200:
-        print(f"Error creating tunnel: {response.status_code}")
-        try:
-            print(response.json())
-        except json.JSONDecodeError:
-            print(f"Response content: {response.content}")
-        sys.exit(1)
-    
-    result = response.json().get("result", {})
+
+    logger.debug("Create tunnel response status: %s", response.status_code)
+    logger.debug("Response content: %s", response.content[:200])
+
+    response.raise_for_status()
+
+    result = _loads(response.content).get("result", {})
     tunnel_id = result.get("id")
     tunnel_name = result.get("name")
-    
-    if debug:
-        print(f"Debug: Created tunnel with ID: {tunnel_id}, Name: {tunnel_name}")
-    
+
+    logger.debug("Created tunnel with ID: %s, Name: %s", tunnel_id, tunnel_name)
+
     if not tunnel_id:
         print("Error: Failed to get tunnel ID from response")
         print(f"Response content: {response.content}")
         sys.exit(1)
-        
+
     return tunnel_id, tunnel_name
 
-def create_tunnel_with_credentials(account_id, tunnel_name, debug=False):
-    headers = get_headers()
-    
-    if debug:
-        print(f"Debug: Creating a fresh tunnel with credentials for {tunnel_name}")
-    
-    # Generate random tunnel secret
-    tunnel_secret = os.urandom(32).hex()
-    
-    if debug:
-        print(f"Debug: Generated tunnel secret (not shown for security)")
-    
+def create_tunnel_with_credentials(account_id, tunnel_name):
+    logger.debug("Creating a fresh tunnel with credentials for %s", tunnel_name)
+
+    # Generate random tunnel secret (not logged for security)
+    tunnel_secret = secrets.token_hex(32)
+
     # Create the tunnel using the newer cfd_tunnel endpoint
     data = {
         "name": tunnel_name,
         "tunnel_secret": tunnel_secret
     }
-    
-    if debug:
-        print(f"Debug: Creating tunnel with API")
-        print(f"Debug: POST {CLOUDFLARE_API_URL}/accounts/{account_id}/cfd_tunnel")
-    
-    response = requests.post(
-        f"{CLOUDFLARE_API_URL}/accounts/{account_id}/cfd_tunnel",
-        headers=headers,
-        json=data
+
+    logger.debug("POST %s", _api(account_id).cfd_tunnel())
+
+    response = get_session().post(
+        _api(account_id).cfd_tunnel(),
+        data=_dumps(data)
     )
-    
-    if debug:
-        print(f"Debug: Tunnel creation response status: {response.status_code}")
-        if response.status_code == 200:
-            try:
-                print(f"Debug: Response preview: {json.dumps(response.json())[:200]}")
-            except:
-                print(f"Debug: Non-JSON response: {response.content[:200]}")
-    
-    if response.status_code != 200:
-        print(f"Error creating tunnel: {response.status_code}")
-        try:
-            print(response.json())
-        except json.JSONDecodeError:
-            print(f"Response content: {response.content}")
-        sys.exit(1)
-    
+
+    logger.debug("Tunnel creation response status: %s", response.status_code)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response preview: %s", _preview(response))
+
+    response.raise_for_status()
+
     # Get the tunnel ID
-    result = response.json().get("result", {})
+    result = _loads(response.content).get("result", {})
     tunnel_id = result.get("id")
-    
+
     if not tunnel_id:
         print("Error: Failed to get tunnel ID from response")
-        print(f"Response: {response.json()}")
+        print(f"Response: {_loads(response.content)}")
         sys.exit(1)
-    
-    if debug:
-        print(f"Debug: Created tunnel with ID: {tunnel_id}")
-    
+
+    logger.debug("Created tunnel with ID: %s", tunnel_id)
+
     # Now get the token for the tunnel
-    token_response = requests.get(
-        f"{CLOUDFLARE_API_URL}/accounts/{account_id}/cfd_tunnel/{tunnel_id}/token",
-        headers=headers
-    )
-    
-    if debug:
-        print(f"Debug: Token retrieval response status: {token_response.status_code}")
-        try:
-            print(f"Debug: Token response preview: {json.dumps(token_response.json())[:200]}")
-        except:
-            print(f"Debug: Non-JSON token response: {token_response.content[:200]}")
-    
-    if token_response.status_code != 200:
-        print(f"Error getting tunnel token: {token_response.status_code}")
-        try:
-            print(token_response.json())
-        except json.JSONDecodeError:
-            print(f"Response content: {token_response.content}")
-        sys.exit(1)
-    
-    tunnel_token = token_response.json().get("result")
-    
+    token_response = get_session().get(_api(account_id).tunnel_token(tunnel_id))
+
+    logger.debug("Token retrieval response status: %s", token_response.status_code)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Token response preview: %s", _preview(token_response))
+
+    token_response.raise_for_status()
+
+    tunnel_token = _loads(token_response.content).get("result")
+
     if not tunnel_token:
         print("Error: Failed to get tunnel token from response")
-        print(f"Response: {token_response.json()}")
+        print(f"Response: {_loads(token_response.content)}")
         sys.exit(1)
-    
-    # Save the tunnel token directly
-    token_file = f"/tmp/cloudflared_token_{tunnel_id}.txt"
-    with open(token_file, "w") as f:
-        f.write(tunnel_token)
-    
-    if debug:
-        print(f"Debug: Saved token to {token_file}")
-        print(f"Debug: Token content: {tunnel_token[:30]}...")
-    
-    return tunnel_id, token_file
-
-def create_tunnel_config(account_id, tunnel_id, tunnel_name, port, local_addr="localhost", custom_domain=None, debug=False):
+
+    return tunnel_id, tunnel_token
+
+def create_tunnel_config(account_id, tunnel_id, tunnel_name, port, local_addr="localhost", custom_domain=None, domain=None):
     # If custom domain is provided, use it
     if custom_domain:
         domain = custom_domain
-        if debug:
-            print(f"Debug: Using custom domain: {domain}")
-    else:
-        # Try to get a domain from the account
-        domain = get_account_domain(account_id, debug)
-    
+        logger.debug("Using custom domain: %s", domain)
+    elif domain is None:
+        # Try to get a domain from the account (unless the caller already resolved one)
+        domain = get_account_domain(account_id)
+
     hostname = f"{tunnel_name}.{domain}"
-    
-    if debug:
-        print(f"Debug: Creating tunnel configuration for tunnel ID: {tunnel_id}")
-        print(f"Debug: Using hostname: {hostname}")
-    
+
+    logger.debug("Creating tunnel configuration for tunnel ID: %s", tunnel_id)
+    logger.debug("Using hostname: %s", hostname)
+
     # Configure the tunnel using the API
-    headers = get_headers()
     config_data = {
         "config": {
             "ingress": [
@@ -265,64 +369,46 @@ def create_tunnel_config(account_id, tunnel_id, tunnel_name, port, local_addr="l
             ]
         }
     }
-    
-    if debug:
-        print(f"Debug: Configuring tunnel with API")
-        print(f"Debug: PUT {CLOUDFLARE_API_URL}/accounts/{account_id}/cfd_tunnel/{tunnel_id}/configurations")
-        print(f"Debug: Configuration: {json.dumps(config_data)}")
-    
-    response = requests.put(
-        f"{CLOUDFLARE_API_URL}/accounts/{account_id}/cfd_tunnel/{tunnel_id}/configurations",
-        headers=headers,
-        json=config_data
+
+    logger.debug("PUT %s", _api(account_id).tunnel_configurations(tunnel_id))
+
+    response = get_session().put(
+        _api(account_id).tunnel_configurations(tunnel_id),
+        data=_dumps(config_data)
     )
-    
-    if debug:
-        print(f"Debug: Configuration response status: {response.status_code}")
-        try:
-            print(f"Debug: Response: {json.dumps(response.json())[:200]}")
-        except:
-            print(f"Debug: Could not parse response as JSON: {response.content[:200]}")
-    
+
+    logger.debug("Configuration response status: %s", response.status_code)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response preview: %s", _preview(response))
+
     # Try to set up DNS for the tunnel
     try:
         # Find the correct zone ID for the domain
-        headers = get_headers()
         zone_id = None
-        
+
         if custom_domain:
             # If using a custom domain, try to find the zone ID for it
-            zones_response = requests.get(
-                f"{CLOUDFLARE_API_URL}/zones?name={custom_domain}",
-                headers=headers
+            zones_response = get_session().get(
+                f"{CLOUDFLARE_API_URL}/zones?name={custom_domain}"
             )
-            
-            if debug:
-                print(f"Debug: Looking for zone ID for custom domain: {custom_domain}")
-                print(f"Debug: Zones response status: {zones_response.status_code}")
-            
+
+            logger.debug("Looking for zone ID for custom domain: %s", custom_domain)
+            logger.debug("Zones response status: %s", zones_response.status_code)
+
             if zones_response.status_code == 200:
-                zones = zones_response.json().get("result", [])
+                zones = _loads(zones_response.content).get("result", [])
                 if zones:
                     zone_id = zones[0]["id"]
-                    if debug:
-                        print(f"Debug: Found zone ID for {custom_domain}: {zone_id}")
-        
+                    logger.debug("Found zone ID for %s: %s", custom_domain, zone_id)
+
         # If no zone ID found (or no custom domain), try to get zones from the account
         if not zone_id:
             # Get all zones from the account
-            zones_response = requests.get(
-                f"{CLOUDFLARE_API_URL}/accounts/{account_id}/zones",
-                headers=headers
-            )
-            
-            if zones_response.status_code == 200:
-                zones = zones_response.json().get("result", [])
-                if zones:
-                    zone_id = zones[0]["id"]
-                    if debug:
-                        print(f"Debug: Using zone ID from account: {zone_id}")
-        
+            zones = _get_zones(account_id)
+            if zones:
+                zone_id = zones[0]["id"]
+                logger.debug("Using zone ID from account: %s", zone_id)
+
         # Only create DNS records if we have a valid zone_id
         if zone_id:
             # Create CNAME DNS record
@@ -333,294 +419,214 @@ def create_tunnel_config(account_id, tunnel_id, tunnel_name, port, local_addr="l
                 "ttl": 1,  # Auto
                 "proxied": True
             }
-            
-            if debug:
-                print(f"Debug: Creating DNS record")
-                print(f"Debug: Using zone ID: {zone_id}")
-            
-            dns_response = requests.post(
-                f"{CLOUDFLARE_API_URL}/zones/{zone_id}/dns_records",
-                headers=headers,
-                json=dns_data
+
+            logger.debug("Creating DNS record in zone %s", zone_id)
+
+            dns_response = get_session().post(
+                _api(account_id).dns_records(zone_id),
+                data=_dumps(dns_data)
             )
-        elif debug:
-            print(f"Debug: No zone ID found, skipping DNS record creation")
-        
-        # Only process DNS response if we actually made a request
-        if zone_id and debug:
-            print(f"Debug: DNS creation response status: {dns_response.status_code}")
-            try:
-                response_json = dns_response.json()
-                print(f"Debug: DNS creation response: {json.dumps(response_json)[:200]}")
-                
-                # Check for error code 81057 (record exists)
-                if not response_json.get("success"):
-                    errors = response_json.get("errors", [])
-                    if errors and errors[0].get("code") in [81057, 81053]:
-                        print(f"Debug: DNS record already exists (this is OK)")
-            except:
-                print(f"Debug: Could not parse DNS response as JSON")
+
+            logger.debug("DNS creation response status: %s", dns_response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    response_json = _loads(dns_response.content)
+                    logger.debug("DNS creation response: %s", json.dumps(response_json)[:200])
+
+                    # Check for error code 81057 (record exists)
+                    if not response_json.get("success"):
+                        errors = response_json.get("errors", [])
+                        if errors and errors[0].get("code") in [81057, 81053]:
+                            logger.debug("DNS record already exists (this is OK)")
+                except Exception:
+                    logger.debug("Could not parse DNS response as JSON")
+        else:
+            logger.debug("No zone ID found, skipping DNS record creation")
     except Exception as e:
-        if debug:
-            print(f"Debug: Failed to set up DNS: {str(e)}")
-            print(f"Debug: This is not critical, continuing")
+        logger.debug("Failed to set up DNS (not critical, continuing): %s", e)
         zone_id = None
-    
+
     return hostname, zone_id  # Return the hostname and zone_id
 
-def get_account_domain(account_id, debug=False):
+def get_account_domain(account_id):
     """Get a domain from the Cloudflare account or use a default."""
-    headers = get_headers()
-    
-    if debug:
-        print(f"Debug: Getting domain for account: {account_id}")
-    
-    # First check for zones (domains) in the account
-    response = requests.get(
-        f"{CLOUDFLARE_API_URL}/accounts/{account_id}/zones",
-        headers=headers
-    )
-    
-    if debug:
-        print(f"Debug: Zones response status: {response.status_code}")
-    
+    logger.debug("Getting domain for account: %s", account_id)
+
     # Default domain in case we can't find one
     domain = "trycloudflare.com"
-    
+
     try:
-        if response.status_code == 200:
-            result = response.json()
-            zones = result.get("result", [])
-            if zones:
-                # Use the first zone/domain in the account
-                domain = zones[0]["name"]
-                if debug:
-                    print(f"Debug: Found domain from account: {domain}")
-                return domain
-            elif debug:
-                print(f"Debug: No zones found in account, using default domain: {domain}")
+        zones = _get_zones(account_id)
+        if zones:
+            # Use the first zone/domain in the account
+            domain = zones[0]["name"]
+            logger.debug("Found domain from account: %s", domain)
+        else:
+            logger.debug("No zones found in account, using default domain: %s", domain)
     except Exception as e:
-        if debug:
-            print(f"Debug: Error getting zones: {str(e)}")
-            print(f"Debug: Using default domain: {domain}")
-    
+        logger.debug("Error getting zones, using default domain %s: %s", domain, e)
+
     return domain
 
-def delete_tunnel_and_dns(account_id, tunnel_id, tunnel_name, zone_id=None, debug=False):
+def delete_tunnel_and_dns(account_id, tunnel_id, tunnel_name, zone_id=None):
     """Delete the tunnel and its DNS records across all zones"""
-    headers = get_headers()
-    
     # 1. Get all zones in the account to ensure we check everywhere for the DNS record
+    all_zones = []
     try:
-        if debug:
-            print(f"Debug: Getting list of zones for account {account_id}")
-        
-        zones_response = requests.get(
-            f"{CLOUDFLARE_API_URL}/accounts/{account_id}/zones",
-            headers=headers
-        )
-        
-        all_zones = []
-        if zones_response.status_code == 200:
-            zones_data = zones_response.json()
-            all_zones = zones_data.get("result", [])
-            if debug:
-                print(f"Debug: Found {len(all_zones)} zones in account")
-        else:
-            # If we can't get all zones but have a specified zone_id, use that
-            if zone_id:
-                all_zones = [{"id": zone_id, "name": "unknown"}]
-                if debug:
-                    print(f"Debug: Using provided zone_id: {zone_id}")
+        logger.debug("Getting list of zones for account %s", account_id)
+        all_zones = _get_zones(account_id)
+        logger.debug("Found %d zones in account", len(all_zones))
     except Exception as e:
-        if debug:
-            print(f"Debug: Error getting zones: {str(e)}")
-        # Use the provided zone_id as fallback
-        if zone_id:
-            all_zones = [{"id": zone_id, "name": "unknown"}]
-    
+        logger.debug("Error getting zones: %s", e)
+
     # If we still don't have any zones and have a hardcoded ID, use it
     if not all_zones and zone_id:
         all_zones = [{"id": zone_id, "name": "unknown"}]
-    
+
     # 2. Look for DNS records in all zones
-    dns_records_deleted = 0
-    
-    for zone in all_zones:
+    # One listing per zone catches both the exact match and any
+    # "{tunnel_name}.{domain}" records, so there is no second lookup.
+    name_pattern = re.compile(rf"^{re.escape(tunnel_name)}(\.|$)")
+
+    # The scans and deletes are pure network wait, so fan them out across
+    # threads; the pooled session is thread-safe and sized for this.
+    def scan_zone(zone):
         current_zone_id = zone["id"]
         zone_name = zone.get("name", "unknown")
-        
+        found = []
+
         try:
-            if debug:
-                print(f"Debug: Checking for DNS records in zone {zone_name} ({current_zone_id})")
-            
-            # First try an exact match with the tunnel name
-            dns_list_response = requests.get(
-                f"{CLOUDFLARE_API_URL}/zones/{current_zone_id}/dns_records?name={tunnel_name}",
-                headers=headers
+            logger.debug("Checking for DNS records in zone %s (%s)", zone_name, current_zone_id)
+
+            dns_list_response = get_session().get(
+                f"{_api(account_id).dns_records(current_zone_id)}?per_page=1000"
             )
-            
+
             if dns_list_response.status_code == 200:
-                dns_records = dns_list_response.json().get("result", [])
-                if dns_records:
-                    for record in dns_records:
-                        dns_id = record["id"]
-                        record_name = record.get("name", "unknown")
-                        
-                        if debug:
-                            print(f"Debug: Found DNS record '{record_name}' with ID: {dns_id}")
-                        
-                        # Delete the DNS record
-                        delete_dns_response = requests.delete(
-                            f"{CLOUDFLARE_API_URL}/zones/{current_zone_id}/dns_records/{dns_id}",
-                            headers=headers
-                        )
-                        
-                        if delete_dns_response.status_code == 200:
-                            dns_records_deleted += 1
-                            if debug:
-                                print(f"Debug: Successfully deleted DNS record '{record_name}'")
-                        elif debug:
-                            print(f"Debug: Failed to delete DNS record '{record_name}': {delete_dns_response.status_code}")
-            
-            # Also try to find records that might include this tunnel name (with domain suffixes)
-            # For example, if tunnel_name is "myapp-12345", search for "myapp-12345.example.com"
-            if "." not in tunnel_name:  # Only if tunnel_name itself is not a full domain
-                dns_list_response = requests.get(
-                    f"{CLOUDFLARE_API_URL}/zones/{current_zone_id}/dns_records",
-                    headers=headers
-                )
-                
-                if dns_list_response.status_code == 200:
-                    all_dns_records = dns_list_response.json().get("result", [])
-                    for record in all_dns_records:
-                        record_name = record.get("name", "")
-                        # Check if this record begins with our tunnel name
-                        if record_name.startswith(f"{tunnel_name}.") or record_name == tunnel_name:
-                            dns_id = record["id"]
-                            
-                            if debug:
-                                print(f"Debug: Found additional DNS record '{record_name}' with ID: {dns_id}")
-                            
-                            # Delete the DNS record
-                            delete_dns_response = requests.delete(
-                                f"{CLOUDFLARE_API_URL}/zones/{current_zone_id}/dns_records/{dns_id}",
-                                headers=headers
-                            )
-                            
-                            if delete_dns_response.status_code == 200:
-                                dns_records_deleted += 1
-                                if debug:
-                                    print(f"Debug: Successfully deleted DNS record '{record_name}'")
-                            elif debug:
-                                print(f"Debug: Failed to delete DNS record '{record_name}': {delete_dns_response.status_code}")
+                for record in _loads(dns_list_response.content).get("result", []):
+                    record_name = record.get("name", "")
+                    # Match the tunnel name exactly or with a domain suffix
+                    if name_pattern.match(record_name):
+                        logger.debug("Found DNS record '%s' with ID: %s", record_name, record['id'])
+                        found.append((current_zone_id, record["id"], record_name))
         except Exception as e:
-            if debug:
-                print(f"Debug: Error checking/deleting DNS records in zone {zone_name}: {str(e)}")
-    
-    if debug:
-        print(f"Debug: Total DNS records deleted: {dns_records_deleted}")
-    
+            logger.debug("Error checking DNS records in zone %s: %s", zone_name, e)
+
+        return found
+
+    def delete_record(record):
+        record_zone_id, dns_id, record_name = record
+        try:
+            delete_dns_response = get_session().delete(
+                _api(account_id).dns_records(record_zone_id, dns_id)
+            )
+        except Exception as e:
+            logger.debug("Error deleting DNS record '%s': %s", record_name, e)
+            return 0
+
+        if delete_dns_response.status_code == 200:
+            logger.debug("Successfully deleted DNS record '%s'", record_name)
+            return 1
+        logger.debug("Failed to delete DNS record '%s': %s", record_name, delete_dns_response.status_code)
+        return 0
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        to_delete = [record for found in executor.map(scan_zone, all_zones) for record in found]
+        dns_records_deleted = sum(executor.map(delete_record, to_delete))
+
+    logger.debug("Total DNS records deleted: %d", dns_records_deleted)
+
     # 3. Delete the tunnel
-    tunnel_deleted = False
     try:
-        if debug:
-            print(f"Debug: Attempting to delete tunnel {tunnel_id}")
-        
-        delete_tunnel_response = requests.delete(
-            f"{CLOUDFLARE_API_URL}/accounts/{account_id}/cfd_tunnel/{tunnel_id}",
-            headers=headers
+        logger.debug("Attempting to delete tunnel %s", tunnel_id)
+
+        delete_tunnel_response = get_session().delete(
+            _api(account_id).cfd_tunnel(tunnel_id)
         )
-        
+
         if delete_tunnel_response.status_code == 200:
-            tunnel_deleted = True
-            if debug:
-                print(f"Debug: Successfully deleted tunnel {tunnel_id}")
-        elif debug:
-            print(f"Debug: Tunnel delete response: {delete_tunnel_response.status_code}")
+            logger.debug("Successfully deleted tunnel %s", tunnel_id)
+        else:
+            logger.debug("Tunnel delete response: %s", delete_tunnel_response.status_code)
     except Exception as e:
-        if debug:
-            print(f"Debug: Error deleting tunnel: {str(e)}")
-    
+        logger.debug("Error deleting tunnel: %s", e)
+
     # Return the number of deleted DNS records
     return dns_records_deleted
 
-def run_cloudflared(token_file, config_file, tunnel_id, account_id, tunnel_name, debug=False, zone_id=None):
-    if debug:
-        print(f"Debug: Running cloudflared with token file: {token_file}")
-    
-    # Read token from file
-    with open(token_file, "r") as f:
-        token = f.read().strip()
-    
-    if debug:
-        print(f"Debug: Read token from file, length: {len(token)}")
-    
+def _pump_output(pipe, out):
+    """Copy a subprocess pipe to `out` line by line until EOF."""
+    with pipe:
+        for line in pipe:
+            out.write(line)
+
+def run_cloudflared(token, tunnel_id, account_id, tunnel_name, zone_id=None):
+    logger.debug("Running cloudflared with in-memory token, length: %d", len(token))
+
     # Run cloudflared using the token directly as argument
     cmd = [
         "cloudflared", "tunnel", "run",
         "--token", token
     ]
-    
-    if debug:
-        print(f"Debug: Running command: {' '.join(cmd)}")
-    
-    process = subprocess.Popen(cmd, 
-                             stdout=subprocess.PIPE if debug else None,
-                             stderr=subprocess.PIPE if debug else None)
-    
-    # If debug mode is on, log whether we have a zone_id or not
-    if debug:
-        if zone_id:
-            print(f"Debug: Using zone ID: {zone_id}")
-        else:
-            print(f"Debug: No zone ID provided, will attempt to find zones during cleanup")
-    
-    # Clean up function to remove token file, terminate process, and cleanup cloudflare resources
+
+    if logger.isEnabledFor(logging.DEBUG):
+        process = subprocess.Popen(cmd,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.STDOUT,
+                                 bufsize=1,
+                                 text=True)
+        # Drain the pipe continuously so cloudflared never blocks once its
+        # logs exceed the OS pipe buffer
+        threading.Thread(target=_pump_output, args=(process.stdout, sys.stderr), daemon=True).start()
+    else:
+        process = subprocess.Popen(cmd)
+
+    if zone_id:
+        logger.debug("Using zone ID: %s", zone_id)
+    else:
+        logger.debug("No zone ID provided, will attempt to find zones during cleanup")
+
+    # Clean up function to terminate process and cleanup cloudflare resources
     def cleanup():
-        if os.path.exists(token_file):
-            os.remove(token_file)
-            if debug:
-                print(f"Debug: Removed token file {token_file}")
         if process.poll() is None:
             process.terminate()
-            if debug:
-                print(f"Debug: Terminated cloudflared process")
-        
+            logger.debug("Terminated cloudflared process")
+
         print("🧹 Cleaning up Cloudflare resources...")
-        dns_records_deleted = delete_tunnel_and_dns(account_id, tunnel_id, tunnel_name, zone_id, debug)
+        dns_records_deleted = delete_tunnel_and_dns(account_id, tunnel_id, tunnel_name, zone_id)
         print(f"✅ Cleanup complete! Removed tunnel and {dns_records_deleted} DNS record(s)")
-    
+
     # Register cleanup on exit
     atexit.register(cleanup)
-    
+
     # Handle keyboard interrupt
     def signal_handler(sig, frame):
-        if debug:
-            print(f"Debug: Received signal {sig}, cleaning up")
+        logger.debug("Received signal %s, cleaning up", sig)
         cleanup()
         sys.exit(0)
-    
+
     signal.signal(signal.SIGINT, signal_handler)
-    
-    # If in debug mode, show initial output
-    if debug:
-        # Give the process a moment to start
-        time.sleep(1)
+
+    # In debug mode, report initial status (output itself is streamed by
+    # the pump thread)
+    if logger.isEnabledFor(logging.DEBUG):
+        # Poll briefly so an immediate crash is caught without holding up
+        # startup for a full second when the process comes up fine
+        for _ in range(10):
+            if process.poll() is not None:
+                break
+            time.sleep(0.05)
         if process.poll() is not None:  # Process has already exited
-            stdout, stderr = process.communicate()
-            print(f"Debug: Process exited with code {process.returncode}")
-            print(f"Debug: stdout: {stdout.decode() if stdout else 'None'}")
-            print(f"Debug: stderr: {stderr.decode() if stderr else 'None'}")
+            logger.debug("Process exited with code %s", process.returncode)
         else:
-            print(f"Debug: Process is running with PID {process.pid}")
-    
+            logger.debug("Process is running with PID %s", process.pid)
+
     return process
 
 def check_cloudflared_installed():
     try:
-        subprocess.run(["cloudflared", "--version"], 
-                      stdout=subprocess.PIPE, 
+        subprocess.run(["cloudflared", "--version"],
+                      stdout=subprocess.PIPE,
                       stderr=subprocess.PIPE)
         return True
     except FileNotFoundError:
@@ -634,35 +640,48 @@ def install_instructions():
     print("  - Others: Visit https://developers.cloudflare.com/cloudflare-one/connections/connect-apps/install-and-setup/installation")
     sys.exit(1)
 
-def main():
-    parser = argparse.ArgumentParser(description="Cloudflare tunnel wrapper that works like ngrok")
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        description="Cloudflare tunnel wrapper that works like ngrok",
+        allow_abbrev=False
+    )
     parser.add_argument("tunnel_name", help="Name for the tunnel", nargs='?')
     parser.add_argument("port", type=int, help="Local port to expose")
     parser.add_argument("domain", nargs='?', help="Custom domain to use (e.g., example.com)")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     parser.add_argument("--local-addr", default="localhost", help="Local address to forward to (default: localhost)")
     parser.add_argument("--no-timestamp", action="store_true", help="Don't add timestamp to tunnel name")
-    args = parser.parse_args()
-    
+    return parser
+
+def main():
+    args = _build_parser().parse_args()
+
+    import requests
+
     debug = args.debug
-    
-    if debug:
-        print(f"Debug: Starting in debug mode")
-        print(f"Debug: Python version: {sys.version}")
-        print(f"Debug: System: {sys.platform}")
-    
+
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.WARNING,
+        format="%(levelname)s: %(message)s"
+    )
+
+    logger.debug("Starting in debug mode")
+    logger.debug("Python version: %s", sys.version)
+    logger.debug("System: %s", sys.platform)
+
     if not check_cloudflared_installed():
         install_instructions()
-    
+
     # Handle tunnel name and domain parameters
     port = args.port
     local_addr = args.local_addr
     custom_domain = args.domain
-    
+
     # Handle auto-generated tunnel name case
     if args.tunnel_name is None:
         # Generate a random name if none provided
-        random_name = ''.join(random.choices(string.ascii_lowercase, k=8))
+        random_name = secrets.token_hex(4)
         base_name = random_name
         tunnel_name = random_name
         print(f"🚀 Creating auto-named tunnel for {local_addr}:{port}...")
@@ -675,48 +694,62 @@ def main():
             timestamp = int(time.time())
             tunnel_name = f"{base_name}-{timestamp}"
         print(f"🚀 Creating tunnel '{base_name}' for {local_addr}:{port}...")
-    
+
     try:
         # Check API key first
         api_key = get_api_key()
-        if debug:
-            if '@' in api_key:
-                print(f"Debug: Using Global API Key (email:key format)")
-            else:
-                print(f"Debug: Using API Token format")
-        
+        if '@' in api_key:
+            logger.debug("Using Global API Key (email:key format)")
+        else:
+            logger.debug("Using API Token format")
+
         account_id = get_account_id()
-        
-        if debug:
-            print(f"Debug: Account ID: {account_id}")
-            
+
+        logger.debug("Account ID: %s", account_id)
+
         # With timestamped unique names, we don't need to check for existing tunnels
-        if debug:
-            print(f"Debug: Using unique tunnel name: {tunnel_name}")
-            
-        # Create a new tunnel with credentials
-        tunnel_id, token_file = create_tunnel_with_credentials(account_id, tunnel_name, debug)
-        
-        if debug:
-            print(f"Debug: Created tunnel with ID: {tunnel_id}")
-        
+        logger.debug("Using unique tunnel name: %s", tunnel_name)
+
+        # Create a new tunnel with credentials. The account-domain lookup is
+        # independent of the tunnel POST, so overlap the two instead of
+        # paying for them back to back.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tunnel_future = executor.submit(create_tunnel_with_credentials, account_id, tunnel_name)
+            domain_future = None
+            if not custom_domain:
+                domain_future = executor.submit(get_account_domain, account_id)
+            tunnel_id, tunnel_token = tunnel_future.result()
+            domain = domain_future.result() if domain_future else None
+
+        logger.debug("Created tunnel with ID: %s", tunnel_id)
+
         # We need to capture the zone_id from the config creation
-        hostname, zone_id = create_tunnel_config(account_id, tunnel_id, tunnel_name, port, local_addr, custom_domain, debug)
-        
-        print(f"✅ Tunnel created successfully!")
+        hostname, zone_id = create_tunnel_config(account_id, tunnel_id, tunnel_name, port, local_addr, custom_domain, domain=domain)
+
+        print("✅ Tunnel created successfully!")
         print(f"🌐 Public URL: https://{hostname}")
         print(f"⚡ Forwarding to: {local_addr}:{port}")
         print("🔄 Starting cloudflared tunnel client...")
         print("🛑 Press Ctrl+C to stop")
-        
-        process = run_cloudflared(token_file, None, tunnel_id, account_id, tunnel_name, debug, zone_id)
-        
+
+        process = run_cloudflared(tunnel_token, tunnel_id, account_id, tunnel_name, zone_id)
+
         # Wait for the process to finish
         try:
             process.wait()
         except KeyboardInterrupt:
             print("\n🛑 Stopping tunnel...")
             sys.exit(0)
+    except requests.HTTPError as e:
+        # Transient 429/5xx are retried by the session adapter; reaching
+        # here means the API kept failing or returned a hard error
+        print(f"❌ Cloudflare API error: {str(e)}")
+        if e.response is not None:
+            print(f"Response: {e.response.text}")
+        if debug:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
     except requests.RequestException as e:
         print(f"❌ Network error: {str(e)}")
         if debug:
@@ -728,4 +761,4 @@ def main():
         if debug:
             import traceback
             traceback.print_exc()
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
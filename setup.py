@@ -18,6 +18,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.25.0",
+        "orjson>=3.6.0",
     ],
     classifiers=[
         "Development Status :: 4 - Beta",